@@ -40,13 +40,13 @@ expectDict = {
     "Choose Test/Continue to restart.": "5",
 }
 
-expects = list(expectDict.keys())
+expects = child.compile_pattern_list(list(expectDict.keys()))  # compile once, not on every expect() call
 responses = list(expectDict.values())
 
 while True:
     try:
         sleep(2)
-        index = child.expect(expects, timeout=2)
+        index = child.expect_list(expects, timeout=2)
         child.sendline(responses[index])
     except pexpect.exceptions.EOF:
         break